@@ -6,9 +6,11 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import contextlib
 import itertools
 import json
+import multiprocessing
 import os
 import random
 import shutil
@@ -25,9 +27,6 @@ from io import TextIOWrapper
 from types import TracebackType
 from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type, cast
 
-import requests
-import tabulate
-
 TweaksType = Optional[Iterable[Tuple[str, Any]]]
 Env_VarsType = Optional[Dict[str, str]]
 
@@ -57,6 +56,7 @@ class ShellSession:
     ) -> None:
         if self.foutput is not None:
             self.foutput.close()
+            self.foutput = None
 
     @contextlib.contextmanager
     def set_env(self, *env_varss: dict[str, str] | None) -> Iterator[None]:
@@ -83,25 +83,32 @@ class ShellSession:
         self.print("\n######> ", end="")
         self.print(*args, **kwargs)
 
-    def run_command(self, cmd: str) -> str:
+    def run_command(self, cmd: str, capture: bool = True) -> str:
         """
         Run a command line (with a shell).
 
+        If `capture` is false, the output goes straight to the log file
+        instead of being collected in memory, and isn't returned.  Use it
+        for the timed test runs, which can be long and chatty.
+
         Returns:
-            str: the output of the command.
+            str: the output of the command, or "" if not capturing.
 
         """
         self.print(f"\n### ========================\n$ {cmd}")
+        if self.foutput is not None:
+            # The command writes to the file directly, after what we've printed.
+            self.foutput.flush()
         start = time.perf_counter()
         proc = subprocess.run(
             cmd,
             shell=True,
             check=False,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.PIPE if capture else (self.foutput or subprocess.DEVNULL),
             stderr=subprocess.STDOUT,
             env=cast(Mapping[str, str], self.env_vars),
         )
-        output = proc.stdout.decode("utf-8")
+        output = proc.stdout.decode("utf-8") if capture else ""
         self.last_duration = time.perf_counter() - start
         self.print(output, end="")
         self.print(f"(was: {cmd})")
@@ -109,6 +116,8 @@ class ShellSession:
 
         if proc.returncode != 0:
             self.print(f"ERROR: command returned {proc.returncode}")
+            if not capture:
+                output = f"(see {os.path.abspath(self.output_filename)})"
             raise Exception(
                 f"Command failed ({proc.returncode}): {cmd!r}, output was:\n{output}"
             )
@@ -124,6 +133,25 @@ def rmrf(path: Path) -> None:
         shutil.rmtree(path)
 
 
+def _stamp_file(path: Path) -> Path:
+    return path.with_name(path.name + ".stamp")
+
+
+def stamp_matches(path: Path, stamp: str) -> bool:
+    """
+    Was `path` completely prepared as described by `stamp`?
+    """
+    stamp_file = _stamp_file(path)
+    return path.exists() and stamp_file.exists() and stamp_file.read_text() == stamp
+
+
+def write_stamp(path: Path, stamp: str) -> None:
+    """
+    Record that `path` has been completely prepared as described by `stamp`.
+    """
+    _stamp_file(path).write_text(stamp)
+
+
 @contextlib.contextmanager
 def change_dir(newdir: Path) -> Iterator[Path]:
     """
@@ -180,6 +208,8 @@ def url_must_exist(url: str) -> bool:
 
     Raises an exception if it doesn't exist.
     """
+    import requests  # Slow to import, so only imported when needed.
+
     resp = requests.head(url)
     resp.raise_for_status()
     return True
@@ -191,7 +221,19 @@ class ProjectToTest:
     # Where can we clone the project from?
     git_url: str = ""
     slug: str = ""
-    env_vars: Env_VarsType = {}
+    env_vars: Env_VarsType = {
+        # Don't let pytest's cache carry state from one run to the next.
+        "PYTEST_ADDOPTS": "-p no:cacheprovider",
+    }
+    # Test runner arguments to run a small representative part of the test
+    # suite, for quick experiments.
+    small_selector: str | None = None
+    # Should we run only the small_selector tests?
+    quick: bool = False
+    # The package the test suite is measuring, for source_only experiments.
+    source_package: str | None = None
+    # Should we measure only source_package?
+    source_only: bool = False
 
     def __init__(self) -> None:
         url_must_exist(self.git_url)
@@ -202,10 +244,18 @@ class ProjectToTest:
     def shell(self) -> ShellSession:
         return ShellSession(f"output_{self.slug}.log")
 
-    def make_dir(self) -> None:
+    def make_dir(self, stamp: str) -> bool:
+        """Choose the directory for the source of the project.
+
+        If the directory was already prepared as described by `stamp`, it's
+        kept and True is returned.  Otherwise it's removed, and False is
+        returned.
+        """
         self.dir = Path(f"work_{self.slug}")
-        if self.dir.exists():
-            rmrf(self.dir)
+        if stamp_matches(self.dir, stamp):
+            return True
+        rmrf(self.dir)
+        return False
 
     def get_source(self, shell: ShellSession, retries: int = 5) -> None:
         """Get the source of the project."""
@@ -224,6 +274,24 @@ class ProjectToTest:
         This is not timed.
         """
 
+    def precompile(self, env: Env) -> None:
+        """Compile the project's source to .pyc files ahead of the timed runs.
+
+        pip already compiles what it installs, but the checkout's own files,
+        like its tests, would otherwise be compiled by the first timed run.
+        This is not timed.
+        """
+        # Some projects have deliberately broken files in their test data.
+        env.shell.run_command(
+            f"{env.python} -m compileall -q -j 0 . || true", capture=False
+        )
+
+    def selector(self) -> str:
+        """Test runner arguments choosing which tests to run, maybe empty."""
+        if self.quick and self.small_selector:
+            return self.small_selector
+        return ""
+
     @contextlib.contextmanager
     def tweak_coverage_settings(self, settings: TweaksType) -> Iterator[None]:
         """Tweak the coverage settings.
@@ -232,6 +300,35 @@ class ProjectToTest:
         """
         yield
 
+    def forced_settings(self) -> dict[str, str]:
+        """The [run] settings to force on coverage.py, maybe none."""
+        if self.source_only and self.source_package:
+            return {
+                "source": self.source_package,
+                "disable_warnings": "no-data-collected",
+            }
+        return {}
+
+    @contextlib.contextmanager
+    def force_coverage_settings(self, env: Env) -> Iterator[None]:
+        """Force the `forced_settings()` on coverage.py.
+
+        They're written to a file named by COVERAGE_FORCE_CONFIG, so they
+        override all other configuration, including the test runner's.
+        Versions of coverage.py that don't read COVERAGE_FORCE_CONFIG
+        ignore them.
+        """
+        settings = self.forced_settings()
+        if not settings:
+            yield
+            return
+        pforce = Path("force.ini").resolve()
+        pforce.write_text(
+            "[run]\n" + "".join(f"{name} = {value}\n" for name, value in settings.items())
+        )
+        with env.shell.set_env({"COVERAGE_FORCE_CONFIG": str(pforce)}):
+            yield
+
     def pre_check(self, env: Env) -> None:
         pass
 
@@ -248,7 +345,7 @@ class ProjectToTest:
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
         """Run the test suite with coverage measurement.
 
-        Must install a particular version of coverage using `cov_ver.pip_args`.
+        Must install a particular version of coverage using `cov_ver.install`.
 
         Returns the duration of the run.
         """
@@ -280,7 +377,10 @@ class ToxProject(ProjectToTest):
     env_vars: Env_VarsType = {
         **(ProjectToTest.env_vars or {}),
         # Allow some environment variables into the tox execution.
-        "TOX_OVERRIDE": "testenv.pass_env+=COVERAGE_DEBUG,COVERAGE_CORE,COVERAGE_FORCE_CONFIG",
+        "TOX_OVERRIDE": (
+            "testenv.pass_env+="
+            + "COVERAGE_DEBUG,COVERAGE_CORE,COVERAGE_FORCE_CONFIG,PYTEST_ADDOPTS"
+        ),
         "COVERAGE_DEBUG": "config,sys",
     }
 
@@ -290,7 +390,9 @@ class ToxProject(ProjectToTest):
 
     def run_tox(self, env: Env, toxenv: str, toxargs: str = "") -> float:
         """Run a tox command. Return the duration."""
-        env.shell.run_command(f"{env.python} -m tox -v -e {toxenv} {toxargs}")
+        env.shell.run_command(
+            f"{env.python} -m tox -v -e {toxenv} {toxargs}", capture=False
+        )
         return env.shell.last_duration
 
     def run_no_coverage(self, env: Env) -> float:
@@ -298,9 +400,7 @@ class ToxProject(ProjectToTest):
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
         self.run_tox(env, env.pyver.toxenv, "--notest")
-        env.shell.run_command(
-            f".tox/{env.pyver.toxenv}/bin/python -m pip install {cov_ver.pip_args}"
-        )
+        cov_ver.install(env, f".tox/{env.pyver.toxenv}/bin/python")
         with self.tweak_coverage_settings(cov_ver.tweaks):
             self.pre_check(env)  # NOTE: Not properly factored, and only used from here.
             duration = self.run_tox(env, env.pyver.toxenv, "--skip-pkg-install")
@@ -319,9 +419,7 @@ class ProjectPytestHtml(ToxProject):
         raise Exception("This doesn't work because options changed to tweaks")
         covenv = env.pyver.toxenv + "-cov"  # type: ignore[unreachable]
         self.run_tox(env, covenv, "--notest")
-        env.shell.run_command(
-            f".tox/{covenv}/bin/python -m pip install {cov_ver.pip_args}"
-        )
+        cov_ver.install(env, f".tox/{covenv}/bin/python")
         if cov_ver.tweaks:
             replace = ("# reference: https", f"[run]\n{cov_ver.tweaks}\n#")
         else:
@@ -384,6 +482,8 @@ class ProjectDjango(ToxProject):
 
 class ProjectMashumaro(ProjectToTest):
     git_url = "https://github.com/Fatal1ty/mashumaro"
+    source_package = "mashumaro"
+    small_selector = "-k ck"
 
     def __init__(self, more_pytest_args: str = ""):
         super().__init__()
@@ -394,13 +494,18 @@ class ProjectMashumaro(ProjectToTest):
         env.shell.run_command(f"{env.python} -m pip install -r requirements-dev.txt")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest {self.more_pytest_args}")
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.more_pytest_args} {self.selector()}",
+            capture=False,
+        )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
+        cov_ver.install(env)
         env.shell.run_command(
             f"{env.python} -m pytest --cov=mashumaro --cov=tests {self.more_pytest_args}"
+            + f" {self.selector()}",
+            capture=False,
         )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
@@ -416,6 +521,7 @@ class ProjectMashumaroBranch(ProjectMashumaro):
 
 class ProjectOperator(ProjectToTest):
     git_url = "https://github.com/nedbat/operator"
+    small_selector = "-k irk"
 
     def __init__(self, more_pytest_args: str = ""):
         super().__init__()
@@ -430,15 +536,17 @@ class ProjectOperator(ProjectToTest):
     def run_no_coverage(self, env: Env) -> float:
         env.shell.run_command(
             f"TMPDIR=/tmp/operator_tmp {env.python} -m tox -e unitnocov --skip-pkg-install"
-            + f" -- {self.more_pytest_args}"
+            + f" -- {self.more_pytest_args} {self.selector()}",
+            capture=False,
         )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
+        cov_ver.install(env)
         env.shell.run_command(
             f"TMPDIR=/tmp/operator_tmp {env.python} -m tox -e unit --skip-pkg-install"
-            + f" -- {self.more_pytest_args}"
+            + f" -- {self.more_pytest_args} {self.selector()}",
+            capture=False,
         )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
@@ -448,16 +556,21 @@ class ProjectOperator(ProjectToTest):
 
 class ProjectPygments(ToxProject):
     git_url = "https://github.com/pygments/pygments"
+    source_package = "pygments"
+    small_selector = "-k basic_api"
+
+    def run_no_coverage(self, env: Env) -> float:
+        return self.run_tox(
+            env, env.pyver.toxenv, f"--skip-pkg-install -- {self.selector()}"
+        )
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
         self.run_tox(env, env.pyver.toxenv, "--notest")
-        env.shell.run_command(
-            f".tox/{env.pyver.toxenv}/bin/python -m pip install {cov_ver.pip_args}"
-        )
+        cov_ver.install(env, f".tox/{env.pyver.toxenv}/bin/python")
         with self.tweak_coverage_settings(cov_ver.tweaks):
             self.pre_check(env)  # NOTE: Not properly factored, and only used here.
             duration = self.run_tox(
-                env, env.pyver.toxenv, "--skip-pkg-install -- --cov"
+                env, env.pyver.toxenv, f"--skip-pkg-install -- --cov {self.selector()}"
             )
             self.post_check(env)  # NOTE: Not properly factored, and only used here.
         return duration
@@ -472,14 +585,17 @@ class ProjectRich(ToxProject):
 
 class ProjectTornado(ToxProject):
     git_url = "https://github.com/tornadoweb/tornado"
+    source_package = "tornado"
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m tornado.test")
+        env.shell.run_command(f"{env.python} -m tornado.test", capture=False)
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        env.shell.run_command(f"{env.python} -m coverage run -m tornado.test")
+        cov_ver.install(env)
+        env.shell.run_command(
+            f"{env.python} -m coverage run -m tornado.test", capture=False
+        )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
         print("Results:", report.splitlines()[-1])
@@ -488,19 +604,25 @@ class ProjectTornado(ToxProject):
 
 class ProjectDulwich(ToxProject):
     git_url = "https://github.com/jelmer/dulwich"
+    source_package = "dulwich"
+    small_selector = "-k test_objects"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install -r requirements.txt")
         env.shell.run_command(f"{env.python} -m pip install .")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m unittest tests.test_suite")
+        env.shell.run_command(
+            f"{env.python} -m unittest tests.test_suite {self.selector()}",
+            capture=False,
+        )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
+        cov_ver.install(env)
         env.shell.run_command(
-            f"{env.python} -m coverage run -m unittest tests.test_suite"
+            f"{env.python} -m coverage run -m unittest tests.test_suite {self.selector()}",
+            capture=False,
         )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
@@ -510,6 +632,7 @@ class ProjectDulwich(ToxProject):
 
 class ProjectBlack(ToxProject):
     git_url = "https://github.com/psf/black"
+    source_package = "black"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install -r test_requirements.txt")
@@ -517,14 +640,16 @@ class ProjectBlack(ToxProject):
 
     def run_no_coverage(self, env: Env) -> float:
         env.shell.run_command(
-            f"{env.python} -m pytest tests --run-optional no_jupyter --no-cov --numprocesses 1"
+            f"{env.python} -m pytest tests --run-optional no_jupyter --no-cov --numprocesses 1",
+            capture=False,
         )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
+        cov_ver.install(env)
         env.shell.run_command(
-            f"{env.python} -m pytest tests --run-optional no_jupyter --cov --numprocesses 1"
+            f"{env.python} -m pytest tests --run-optional no_jupyter --cov --numprocesses 1",
+            capture=False,
         )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
@@ -534,18 +659,23 @@ class ProjectBlack(ToxProject):
 
 class ProjectMpmath(ProjectToTest):
     git_url = "https://github.com/mpmath/mpmath"
+    source_package = "mpmath"
     select = "-k 'not (torture or extra or functions2 or calculus or cli or elliptic or quad)'"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install .[develop]")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest {self.select} --no-cov")
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.select} --no-cov", capture=False
+        )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        env.shell.run_command(f"{env.python} -m pytest {self.select} --cov=mpmath")
+        cov_ver.install(env)
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.select} --cov=mpmath", capture=False
+        )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
         print("Results:", report.splitlines()[-1])
@@ -554,6 +684,7 @@ class ProjectMpmath(ProjectToTest):
 
 class ProjectMypy(ToxProject):
     git_url = "https://github.com/python/mypy"
+    source_package = "mypy"
 
     SLOW_TESTS = " or ".join([
         "PythonCmdline",
@@ -575,35 +706,45 @@ class ProjectMypy(ToxProject):
         env.shell.run_command(f"{env.python} -m pip install -r test-requirements.txt")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest {self.FAST} --no-cov")
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.FAST} --no-cov", capture=False
+        )
         return env.shell.last_duration
 
+    def forced_settings(self) -> dict[str, str]:
+        return {**super().forced_settings(), "branch": "false"}
+
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        pforce = Path("force.ini")
-        pforce.write_text("[run]\nbranch=false\n")
-        with env.shell.set_env({"COVERAGE_FORCE_CONFIG": str(pforce.resolve())}):
-            env.shell.run_command(f"{env.python} -m pytest {self.FAST} --cov")
-            duration = env.shell.last_duration
-            report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
+        cov_ver.install(env)
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.FAST} --cov", capture=False
+        )
+        duration = env.shell.last_duration
+        report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
         print("Results:", report.splitlines()[-1])
         return duration
 
 
 class ProjectHtml5lib(ToxProject):
     git_url = "https://github.com/html5lib/html5lib-python"
+    source_package = "html5lib"
+    small_selector = "-k tokenizer"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install -r requirements-test.txt")
         env.shell.run_command(f"{env.python} -m pip install .")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest")
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.selector()}", capture=False
+        )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        env.shell.run_command(f"{env.python} -m coverage run -m pytest")
+        cov_ver.install(env)
+        env.shell.run_command(
+            f"{env.python} -m coverage run -m pytest {self.selector()}", capture=False
+        )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
         print("Results:", report.splitlines()[-1])
@@ -612,17 +753,18 @@ class ProjectHtml5lib(ToxProject):
 
 class ProjectSphinx(ToxProject):
     git_url = "https://github.com/sphinx-doc/sphinx"
+    source_package = "sphinx"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install .[test]")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest")
+        env.shell.run_command(f"{env.python} -m pytest", capture=False)
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        env.shell.run_command(f"{env.python} -m coverage run -m pytest")
+        cov_ver.install(env)
+        env.shell.run_command(f"{env.python} -m coverage run -m pytest", capture=False)
         duration = env.shell.last_duration
         env.shell.run_command(f"{env.python} -m coverage combine")
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
@@ -632,18 +774,24 @@ class ProjectSphinx(ToxProject):
 
 class ProjectUrllib3(ProjectToTest):
     git_url = "https://github.com/urllib3/urllib3"
+    source_package = "urllib3"
+    small_selector = "-k test_util"
 
     def prep_environment(self, env: Env) -> None:
         env.shell.run_command(f"{env.python} -m pip install -r dev-requirements.txt")
         env.shell.run_command(f"{env.python} -m pip install .")
 
     def run_no_coverage(self, env: Env) -> float:
-        env.shell.run_command(f"{env.python} -m pytest")
+        env.shell.run_command(
+            f"{env.python} -m pytest {self.selector()}", capture=False
+        )
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
-        env.shell.run_command(f"{env.python} -m coverage run -m pytest")
+        cov_ver.install(env)
+        env.shell.run_command(
+            f"{env.python} -m coverage run -m pytest {self.selector()}", capture=False
+        )
         duration = env.shell.last_duration
         report = env.shell.run_command(f"{env.python} -m coverage report --precision=6")
         print("Results:", report.splitlines()[-1])
@@ -691,13 +839,15 @@ class AdHocProject(ProjectToTest):
 
     def run_no_coverage(self, env: Env) -> float:
         with change_dir(self.cur_dir):
-            env.shell.run_command(f"{env.python} {self.python_file}")
+            env.shell.run_command(f"{env.python} {self.python_file}", capture=False)
         return env.shell.last_duration
 
     def run_with_coverage(self, env: Env, cov_ver: Coverage) -> float:
-        env.shell.run_command(f"{env.python} -m pip install {cov_ver.pip_args}")
+        cov_ver.install(env)
         with change_dir(self.cur_dir):
-            env.shell.run_command(f"{env.python} -m coverage run {self.python_file}")
+            env.shell.run_command(
+                f"{env.python} -m coverage run {self.python_file}", capture=False
+            )
         return env.shell.last_duration
 
 
@@ -726,6 +876,8 @@ class PyVersion:
     slug: str
     # The tox environment to run this Python
     toxenv: str
+    # Does this Python have sys.monitoring?
+    has_sysmon: bool = False
 
 
 class Python(PyVersion):
@@ -734,6 +886,7 @@ class Python(PyVersion):
     def __init__(self, major: int, minor: int):
         self.command = self.slug = f"python{major}.{minor}"
         self.toxenv = f"py{major}{minor}"
+        self.has_sysmon = (major, minor) >= (3, 12)
 
 
 class PyPy(PyVersion):
@@ -752,6 +905,12 @@ class AdHocPython(PyVersion):
         file_must_exist(self.command, "python command")
         self.slug = slug
         self.toxenv = ""
+        # Ask the build itself, since its version isn't known here.
+        self.has_sysmon = subprocess.run(
+            [self.command, "-c", "import sys; sys.monitoring"],
+            capture_output=True,
+            check=False,
+        ).returncode == 0
 
 
 @dataclass
@@ -767,6 +926,50 @@ class Coverage:
     # Environment variables to set
     env_vars: Env_VarsType = None
 
+    def env_vars_for(self, pyver: PyVersion) -> Env_VarsType:
+        """The environment variables to set when running under `pyver`.
+
+        Where sys.monitoring is available, it's used unless `env_vars`
+        chooses a different core.
+        """
+        env_vars = dict(self.env_vars or {})
+        if self.pip_args is not None and pyver.has_sysmon:
+            env_vars.setdefault("COVERAGE_CORE", "sysmon")
+        return env_vars
+
+    def fetch(self, env: Env) -> None:
+        """Get what `install` needs for `env.pyver` into the local wheelhouse.
+
+        Releases are only ever installed from wheels, so a missing wheel is an
+        error rather than a slow build from the sdist.  Each wheel is
+        downloaded once.  Parallel runs call this before starting the workers,
+        so that no worker installs from a wheel another is still writing.
+        """
+        if self.pip_args is None:
+            return
+        if (self.pip_args, env.pyver.slug) not in _downloaded_wheels:
+            env.shell.run_command(
+                f"{env.python} -m pip download --only-binary=coverage --no-deps"
+                + f" --dest {WHEELHOUSE} {self.pip_args}"
+            )
+            _downloaded_wheels.add((self.pip_args, env.pyver.slug))
+
+    def install(self, env: Env, python: Path | str | None = None) -> None:
+        """Install this coverage.py into `python`, by default `env.python`."""
+        python = python or env.python
+        self.fetch(env)
+        env.shell.run_command(
+            f"{python} -m pip install --only-binary=coverage --no-index"
+            + f" --find-links {WHEELHOUSE} {self.pip_args}"
+        )
+
+
+# The (pip_args, pyver.slug) pairs already downloaded into the wheelhouse.
+_downloaded_wheels: set[tuple[str | None, str]] = set()
+
+# Wheels built from working trees, keyed by (directory, pyver.slug).
+_source_wheels: dict[tuple[str | None, str], Path] = {}
+
 
 class NoCoverage(Coverage):
     """Run without coverage at all."""
@@ -790,6 +993,13 @@ class CoveragePR(Coverage):
             env_vars=env_vars,
         )
 
+    def fetch(self, env: Env) -> None:
+        pass
+
+    def install(self, env: Env, python: Path | str | None = None) -> None:
+        python = python or env.python
+        env.shell.run_command(f"{python} -m pip install {self.pip_args}")
+
 
 class CoverageCommit(Coverage):
     """A version of coverage.py from a specific commit."""
@@ -806,6 +1016,13 @@ class CoverageCommit(Coverage):
             env_vars=env_vars,
         )
 
+    def fetch(self, env: Env) -> None:
+        pass
+
+    def install(self, env: Env, python: Path | str | None = None) -> None:
+        python = python or env.python
+        env.shell.run_command(f"{python} -m pip install {self.pip_args}")
+
 
 class CoverageSource(Coverage):
     """The coverage.py in a working tree."""
@@ -825,6 +1042,30 @@ class CoverageSource(Coverage):
             env_vars=env_vars,
         )
 
+    def fetch(self, env: Env) -> None:
+        """Build the working tree's wheel, only once per Python.
+
+        The wheel directory is named for this version and the Python, so later
+        experiments replace it rather than adding another one.
+        """
+        key = (self.pip_args, env.pyver.slug)
+        if key not in _source_wheels:
+            wheel_dir = WHEELHOUSE / f"source-{self.slug}-{env.pyver.slug}"
+            rmrf(wheel_dir)
+            env.shell.run_command(
+                f"{env.python} -m pip wheel --no-deps --wheel-dir {wheel_dir} {self.pip_args}"
+            )
+            _source_wheels[key] = next(wheel_dir.glob("coverage-*.whl"))
+
+    def install(self, env: Env, python: Path | str | None = None) -> None:
+        """Install the working tree, building its wheel only once per Python."""
+        python = python or env.python
+        self.fetch(env)
+        wheel = _source_wheels[(self.pip_args, env.pyver.slug)]
+        env.shell.run_command(
+            f"{python} -m pip install --force-reinstall --no-deps {wheel}"
+        )
+
 
 @dataclass
 class Env:
@@ -836,6 +1077,7 @@ class Env:
 
 
 ResultKey = Tuple[str, str, str]
+RunArgs = Tuple[ProjectToTest, PyVersion, Coverage, Env, str]
 
 DIMENSION_NAMES = ["proj", "pyver", "cov"]
 
@@ -848,7 +1090,7 @@ class Experiment:
         py_versions: list[PyVersion],
         cov_versions: list[Coverage],
         projects: list[ProjectToTest],
-        results_file: str = "results.json",
+        results_file: str = "results.jsonl",
         load: bool = False,
         cwd: str = "",
     ):
@@ -856,27 +1098,35 @@ class Experiment:
         self.cov_versions = cov_versions
         self.projects = projects
         self.results_file = Path(cwd) / Path(results_file)
-        self.result_data: dict[ResultKey, list[float]] = (
-            self.load_results() if load else {}
-        )
+        self.result_data: dict[ResultKey, list[float]]
+        if load:
+            self.result_data = self.load_results()
+        else:
+            # Results are appended to the file, so start a new one.
+            self.results_file.unlink(missing_ok=True)
+            self.result_data = {}
         self.summary_data: dict[ResultKey, float] = {}
 
-    def save_results(self) -> None:
-        """Save current results to the JSON file."""
-        with self.results_file.open("w") as f:
-            json.dump({" ".join(k): v for k, v in self.result_data.items()}, f)
+    def save_result(self, result_key: ResultKey, dur: float) -> None:
+        """Append one result to the results file, as a line of JSON."""
+        result = dict(zip(DIMENSION_NAMES, result_key), seconds=dur)
+        with self.results_file.open("a") as f:
+            f.write(json.dumps(result) + "\n")
 
     def load_results(self) -> dict[ResultKey, list[float]]:
-        """Load results from the JSON file if it exists."""
+        """Load results from the results file if it exists."""
+        results: dict[ResultKey, list[float]] = collections.defaultdict(list)
         if self.results_file.exists():
             with self.results_file.open("r") as f:
-                data: dict[str, list[float]] = json.load(f)
-            return {
-                (k.split()[0], k.split()[1], k.split()[2]): v for k, v in data.items()
-            }
-        return {}
+                for line in f:
+                    result = json.loads(line)
+                    result_key = cast(
+                        ResultKey, tuple(result[name] for name in DIMENSION_NAMES)
+                    )
+                    results[result_key].append(result["seconds"])
+        return dict(results)
 
-    def run(self, num_runs: int = 3) -> None:
+    def run(self, num_runs: int = 3, parallel: bool = False, warmup: bool = True) -> None:
         total_runs = (
             len(self.projects)
             * len(self.py_versions)
@@ -891,65 +1141,120 @@ class Experiment:
             with proj.shell() as shell:
                 print(f"Prepping project {proj.slug}")
                 shell.print_banner(f"Prepping project {proj.slug}")
-                proj.make_dir()
-                proj.get_source(shell)
+                source_stamp = f"source: {proj.git_url or proj.slug}"
+                reused_source = proj.make_dir(source_stamp)
+                if reused_source:
+                    print(f"Reusing source for {proj.slug}")
+                else:
+                    proj.get_source(shell)
+                    write_stamp(proj.dir, source_stamp)
 
                 for pyver in self.py_versions:
-                    print(f"Making venv for {proj.slug} {pyver.slug}")
-                    venv_dir = f"venv_{proj.slug}_{pyver.slug}"
-                    shell.run_command(f"{pyver.command} -m venv {venv_dir}")
-                    python = Path.cwd() / f"{venv_dir}/bin/python"
-                    shell.run_command(f"{python} -V")
-                    shell.run_command(f"{python} -m pip install -U pip")
+                    venv_dir = Path(f"venv_{proj.slug}_{pyver.slug}")
+                    python = Path.cwd() / venv_dir / "bin/python"
                     env = Env(pyver, python, shell)
-
-                    with change_dir(proj.dir):
-                        print(f"Prepping for {proj.slug} {pyver.slug}")
-                        proj.prep_environment(env)
-                        for cov_ver in self.cov_versions:
-                            all_runs.append((proj, pyver, cov_ver, env))
+                    venv_stamp = f"python: {pyver.command}"
+                    if reused_source and stamp_matches(venv_dir, venv_stamp):
+                        print(f"Reusing venv for {proj.slug} {pyver.slug}")
+                    else:
+                        print(f"Making venv for {proj.slug} {pyver.slug}")
+                        rmrf(venv_dir)
+                        shell.run_command(f"{pyver.command} -m venv {venv_dir}")
+                        shell.run_command(f"{python} -V")
+                        shell.run_command(f"{python} -m pip install -U pip")
+                        with change_dir(proj.dir):
+                            print(f"Prepping for {proj.slug} {pyver.slug}")
+                            proj.prep_environment(env)
+                            proj.precompile(env)
+                        write_stamp(venv_dir, venv_stamp)
+
+                    for cov_ver in self.cov_versions:
+                        if parallel:
+                            # Workers are forked from here, so they see what
+                            # has already been fetched and don't fetch it again.
+                            cov_ver.fetch(env)
+                        all_runs.append((proj, pyver, cov_ver, env))
 
         all_runs *= num_runs
         random.shuffle(all_runs)
 
         run_data: dict[ResultKey, list[float]] = collections.defaultdict(list)
-        run_data.update(self.result_data)
-
+        # Copy the lists, since record_result appends to both.
+        run_data.update({key: list(data) for key, data in self.result_data.items()})
+
+        # Decide which runs are needed before starting any of them, so that
+        # parallel runs don't duplicate results we already have.  A result
+        # key of None marks a warmup run, whose duration is discarded.
+        num_scheduled = collections.Counter(
+            {key: len(data) for key, data in self.result_data.items()}
+        )
+        warmed_up: set[ResultKey] = set()
+        warmups: list[tuple[ResultKey | None, RunArgs]] = []
+        runs_to_do: list[tuple[ResultKey | None, RunArgs]] = []
         for proj, pyver, cov_ver, env in all_runs:
             result_key = (proj.slug, pyver.slug, cov_ver.slug)
             total_run_num = next(total_run_nums)
-            if (
-                result_key in self.result_data
-                and len(self.result_data[result_key]) >= num_runs
-            ):
+            if num_scheduled[result_key] >= num_runs:
                 print(f"Skipping {result_key} as results already exist.")
                 continue
-
-            with env.shell:
+            if warmup and result_key not in warmed_up:
+                warmed_up.add(result_key)
+                # The first run of a combination fills caches and writes .pyc
+                # files, so it's slower than the rest.
                 banner = (
-                    "Running tests: "
-                    + f"proj={proj.slug}, py={pyver.slug}, cov={cov_ver.slug}, "
-                    + f"{total_run_num} of {total_runs}"
+                    "Warming up: "
+                    + f"proj={proj.slug}, py={pyver.slug}, cov={cov_ver.slug}"
                 )
-                print(banner)
-                env.shell.print_banner(banner)
-                with change_dir(proj.dir):
-                    with env.shell.set_env(proj.env_vars, cov_ver.env_vars):
-                        try:
-                            if cov_ver.pip_args is None:
-                                dur = proj.run_no_coverage(env)
-                            else:
-                                dur = proj.run_with_coverage(env, cov_ver)
-                        except Exception as exc:
-                            print(f"!!! {exc = }")
-                            traceback.print_exc(file=env.shell.foutput)
-                            dur = float("NaN")
-            print(f"Tests took {dur:.3f}s")
+                warmups.append((None, (proj, pyver, cov_ver, env, banner)))
+            num_scheduled[result_key] += 1
+            banner = (
+                "Running tests: "
+                + f"proj={proj.slug}, py={pyver.slug}, cov={cov_ver.slug}, "
+                + f"{total_run_num} of {total_runs}"
+            )
+            runs_to_do.append((result_key, (proj, pyver, cov_ver, env, banner)))
+        runs_to_do = warmups + runs_to_do
+
+        def record_result(result_key: ResultKey | None, dur: float) -> None:
+            if result_key is None:
+                print(f"Warmup took {dur:.3f}s, discarded")
+                return
+            if parallel:
+                print(f"Tests for {', '.join(result_key)} took {dur:.3f}s")
+            else:
+                print(f"Tests took {dur:.3f}s")
             if result_key not in self.result_data:
                 self.result_data[result_key] = []
             self.result_data[result_key].append(dur)
             run_data[result_key].append(dur)
-            self.save_results()
+            self.save_result(result_key, dur)
+
+        if parallel:
+            # Runs of the same project share its source tree and virtualenvs,
+            # so each project's runs are done in order by one worker, and the
+            # projects run in parallel.  The runs change directories, so the
+            # workers are processes rather than threads.  Fork, since "spawn"
+            # would re-run the experiment script's top-level code.
+            runs_by_proj: dict[str, list[tuple[ResultKey | None, RunArgs]]] = (
+                collections.defaultdict(list)
+            )
+            for run_key, run_args in runs_to_do:
+                runs_by_proj[run_args[0].slug].append((run_key, run_args))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, min(os.cpu_count() or 1, len(runs_by_proj))),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = {
+                    executor.submit(run_several, [run_args for _, run_args in runs]):
+                        [run_key for run_key, _ in runs]
+                    for runs in runs_by_proj.values()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    for run_key, dur in zip(futures[future], future.result()):
+                        record_result(run_key, dur)
+        else:
+            for run_key, run_args in runs_to_do:
+                record_result(run_key, run_one(*run_args))
 
         # Summarize and collect the data.
         print("# Results")
@@ -961,9 +1266,13 @@ class Experiment:
                     med = statistics.median(data)
                     self.summary_data[result_key] = med
                     stdev = statistics.stdev(data) if len(data) > 1 else 0.0
+                    # The median absolute deviation isn't thrown off by one
+                    # unlucky run the way the standard deviation is.
+                    mad = statistics.median(abs(d - med) for d in data)
                     summary = (
                         f"Median for {proj.slug}, {pyver.slug}, {cov_ver.slug}: "
                         + f"{med:.3f}s, "
+                        + f"mad={mad:.3f}, "
                         + f"stdev={stdev:.3f}"
                     )
                     if 1:
@@ -1011,11 +1320,51 @@ class Experiment:
                 row.append(f"{ratio * 100:.0f}%")
             data.append(row)
 
+        import tabulate
+
         print()
         print(tabulate.tabulate(data, headers=header, colalign=aligns, tablefmt="pipe"))
 
 
+def run_one(
+    proj: ProjectToTest,
+    pyver: PyVersion,
+    cov_ver: Coverage,
+    env: Env,
+    banner: str,
+) -> float:
+    """Run one cell of the experiment matrix.
+
+    Returns the duration of the test run, or NaN if it failed.
+    """
+    with env.shell:
+        print(banner, flush=True)
+        env.shell.print_banner(banner)
+        with change_dir(proj.dir):
+            with env.shell.set_env(proj.env_vars, cov_ver.env_vars_for(pyver)):
+                try:
+                    if cov_ver.pip_args is None:
+                        dur = proj.run_no_coverage(env)
+                    else:
+                        with proj.force_coverage_settings(env):
+                            dur = proj.run_with_coverage(env, cov_ver)
+                except Exception as exc:
+                    print(f"!!! {exc = }")
+                    traceback.print_exc(file=env.shell.foutput)
+                    dur = float("NaN")
+    return dur
+
+
+def run_several(runs: list[RunArgs]) -> list[float]:
+    """Run a number of cells of the experiment matrix, in order.
+
+    Returns the list of durations.
+    """
+    return [run_one(*run_args) for run_args in runs]
+
+
 PERF_DIR = Path("/tmp/covperf")
+WHEELHOUSE = PERF_DIR / "wheelhouse"
 
 
 def run_experiment(
@@ -1025,8 +1374,13 @@ def run_experiment(
     rows: list[str],
     column: str,
     ratios: Iterable[tuple[str, str, str]] = (),
-    num_runs: int = int(sys.argv[1]),
+    num_runs: int = 3,
     load: bool = False,
+    parallel: bool = False,
+    rebuild: bool = False,
+    warmup: bool = True,
+    quick: bool = False,
+    source_only: bool = False,
 ) -> None:
     """
     Run a benchmarking experiment and print a table of results.
@@ -1040,6 +1394,18 @@ def run_experiment(
         column: The remaining dimension not used in `rows`.
         ratios: A list of triples: (title, slug1, slug2).
         num_runs: The number of times to run each matrix element.
+        load: If true, reuse results already saved in the results file.
+        parallel: If true, run the projects in parallel processes.  This is
+            quicker, but the runs compete for the CPU, so the timings are less
+            reliable.
+        rebuild: If true, remove project checkouts and virtualenvs left by
+            earlier experiments, instead of reusing them.
+        warmup: If true, run each matrix element once more before the timed
+            runs, and discard its duration.
+        quick: If true, run only the `small_selector` tests of projects that
+            define one.
+        source_only: If true, measure only the `source_package` of projects
+            that define one.
 
     """
     slugs = [v.slug for v in py_versions + cov_versions + projects]
@@ -1055,8 +1421,16 @@ def run_experiment(
             f"All of these must be in rows or column: {', '.join(DIMENSION_NAMES)}"
         )
 
-    print(f"Removing and re-making {PERF_DIR}")
-    rmrf(PERF_DIR)
+    if rebuild:
+        print(f"Removing and re-making {PERF_DIR}")
+        rmrf(PERF_DIR)
+        # The wheelhouse was in PERF_DIR, so forget what we put there.
+        _downloaded_wheels.clear()
+        _source_wheels.clear()
+
+    for proj in projects:
+        proj.quick = quick
+        proj.source_only = source_only
 
     cwd = str(Path.cwd())
     with change_dir(PERF_DIR):
@@ -1067,5 +1441,5 @@ def run_experiment(
             load=load,
             cwd=cwd,
         )
-        exp.run(num_runs=int(num_runs))
+        exp.run(num_runs=int(num_runs), parallel=parallel, warmup=warmup)
         exp.show_results(rows=rows, column=column, ratios=ratios)
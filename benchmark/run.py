@@ -1,25 +1,27 @@
 import optparse
 from pathlib import Path
+from typing import Any
 
-from benchmark import *
-
-parser = optparse.OptionParser()
-parser.add_option(
-    "--clean",
-    action="store_true",
-    dest="clean",
-    default=False,
-    help="Delete the results.json file before running benchmarks"
+from benchmark import (
+    AdHocProject,
+    AdHocPython,
+    Coverage,
+    CoverageSource,
+    NoCoverage,
+    ProjectAttrs,
+    ProjectMashumaro,
+    ProjectMashumaroBranch,
+    ProjectMypy,
+    ProjectOperator,
+    ProjectPygments,
+    Python,
+    SlipcoverBenchmark,
+    run_experiment,
 )
-options, args = parser.parse_args()
 
-if options.clean:
-    results_file = Path("results.json")
-    if results_file.exists():
-        results_file.unlink()
-        print("Deleted results.json")
 
-if 0:
+def exp_adhoc_pythons(**options: Any) -> None:
+    """Compare custom builds of Python."""
     run_experiment(
         py_versions=[
             # Python(3, 11),
@@ -41,10 +43,12 @@ if 0:
             ("3.11b3 vs 3.10", "v3.11.0b3", "v3.10.5"),
             ("94231 vs 3.10", "94231", "v3.10.5"),
         ],
+        **options,
     )
 
 
-if 0:
+def exp_dynctx(**options: Any) -> None:
+    """Compare the cost of dynamic contexts in 7.0.1 and 7.0.2."""
     run_experiment(
         py_versions=[
             Python(3, 9),
@@ -70,11 +74,12 @@ if 0:
             (".1 dynctx cost", "701.dynctx", "701"),
             (".2 dynctx cost", "702.dynctx", "702"),
         ],
+        **options,
     )
 
 
-if 0:
-    # Compare two Python versions
+def exp_py_versions(**options: Any) -> None:
+    """Compare two Python versions."""
     v1 = 10
     v2 = 11
     run_experiment(
@@ -93,11 +98,12 @@ if 0:
         ratios=[
             (f"3.{v2} vs 3.{v1}", f"python3.{v2}", f"python3.{v1}"),
         ],
+        **options,
     )
 
-if 1:
-    # Compare sysmon on many projects
 
+def exp_sysmon_many(**options: Any) -> None:
+    """Compare sysmon on many projects."""
     run_experiment(
         py_versions=[
             Python(3, 12),
@@ -105,7 +111,7 @@ if 1:
         cov_versions=[
             NoCoverage("nocov"),
             CoverageSource(slug="ctrace", env_vars={"COVERAGE_CORE": "ctrace"}),
-            CoverageSource(slug="sysmon", env_vars={"COVERAGE_CORE": "sysmon"}),
+            CoverageSource(slug="sysmon"),
         ],
         projects=[
             # ProjectSphinx(),  # Works, slow
@@ -126,10 +132,12 @@ if 1:
             (f"sysmon%", "sysmon", "nocov"),
         ],
         load=True,
+        **options,
     )
 
-if 0:
-    # Compare current Coverage source against shipped version
+
+def exp_latest_vs_shipped(**options: Any) -> None:
+    """Compare current Coverage source against shipped version."""
     run_experiment(
         py_versions=[
             Python(3, 11),
@@ -147,10 +155,12 @@ if 0:
         ratios=[
             (f"Latest vs shipped", "latest", "pip"),
         ],
+        **options,
     )
 
-if 0:
-    # Compare 3.12 coverage vs no coverage
+
+def exp_nocov_312(**options: Any) -> None:
+    """Compare 3.12 coverage vs no coverage."""
     run_experiment(
         py_versions=[
             Python(3, 12),
@@ -158,14 +168,11 @@ if 0:
         cov_versions=[
             NoCoverage("nocov"),
             Coverage("732", "coverage==7.3.2"),
-            CoverageSource(
-                slug="sysmon",
-                env_vars={"COVERAGE_CORE": "sysmon"},
-            ),
+            CoverageSource(slug="sysmon"),
         ],
         projects=[
-            ProjectMashumaro(),     # small: "-k ck"
-            ProjectOperator(),      # small: "-k irk"
+            ProjectMashumaro(),
+            ProjectOperator(),
         ],
         rows=["pyver", "proj"],
         column="cov",
@@ -173,10 +180,12 @@ if 0:
             (f"732%", "732", "nocov"),
             (f"sysmon%", "sysmon", "nocov"),
         ],
+        **options,
     )
 
-if 0:
-    # Compare 3.12 coverage vs no coverage
+
+def exp_nocov_312_branch(**options: Any) -> None:
+    """Compare 3.12 coverage vs no coverage, with and without branches."""
     run_experiment(
         py_versions=[
             Python(3, 12),
@@ -184,14 +193,11 @@ if 0:
         cov_versions=[
             NoCoverage("nocov"),
             Coverage("732", "coverage==7.3.2"),
-            CoverageSource(
-                slug="sysmon",
-                env_vars={"COVERAGE_CORE": "sysmon"},
-            ),
+            CoverageSource(slug="sysmon"),
         ],
         projects=[
-            ProjectMashumaro(),         # small: "-k ck"
-            ProjectMashumaroBranch(),   # small: "-k ck"
+            ProjectMashumaro(),
+            ProjectMashumaroBranch(),
         ],
         rows=["pyver", "proj"],
         column="cov",
@@ -199,4 +205,102 @@ if 0:
             (f"732%", "732", "nocov"),
             (f"sysmon%", "sysmon", "nocov"),
         ],
+        **options,
+    )
+
+
+EXPERIMENTS = {
+    "adhoc_pythons": exp_adhoc_pythons,
+    "dynctx": exp_dynctx,
+    "py_versions": exp_py_versions,
+    "sysmon_many": exp_sysmon_many,
+    "latest_vs_shipped": exp_latest_vs_shipped,
+    "nocov_312": exp_nocov_312,
+    "nocov_312_branch": exp_nocov_312_branch,
+}
+
+
+def main() -> None:
+    parser = optparse.OptionParser(usage="%prog [options] EXPERIMENT [NUM_RUNS]")
+    parser.add_option(
+        "--clean",
+        action="store_true",
+        dest="clean",
+        default=False,
+        help="Delete the results.jsonl file before running benchmarks"
+    )
+    parser.add_option(
+        "--rebuild",
+        action="store_true",
+        dest="rebuild",
+        default=False,
+        help="Delete project checkouts and virtualenvs from earlier runs"
+    )
+    parser.add_option(
+        "--parallel",
+        action="store_true",
+        dest="parallel",
+        default=False,
+        help="Run the projects in parallel (faster, but less accurate timings)"
+    )
+    parser.add_option(
+        "--quick",
+        action="store_true",
+        dest="quick",
+        default=False,
+        help="Run only a small part of each project's tests, where one is defined"
+    )
+    parser.add_option(
+        "--source-only",
+        action="store_true",
+        dest="source_only",
+        default=False,
+        help="Measure only each project's own package, where one is defined"
+    )
+    parser.add_option(
+        "--no-warmup",
+        action="store_false",
+        dest="warmup",
+        default=True,
+        help="Don't do an untimed warmup run of each combination first"
+    )
+    parser.add_option(
+        "--list",
+        action="store_true",
+        dest="list",
+        default=False,
+        help="List the experiments that can be run"
     )
+    options, args = parser.parse_args()
+
+    if options.list:
+        for name, func in EXPERIMENTS.items():
+            print(f"{name}: {func.__doc__}")
+        return
+
+    if not 1 <= len(args) <= 2:
+        parser.error("Specify an experiment to run, and optionally the number of runs")
+    name = args[0]
+    if name not in EXPERIMENTS:
+        parser.error(f"Unknown experiment {name!r}, use --list to see the choices")
+
+    if options.clean:
+        results_file = Path("results.jsonl")
+        if results_file.exists():
+            results_file.unlink()
+            print("Deleted results.jsonl")
+
+    run_options: dict[str, Any] = {
+        "parallel": options.parallel,
+        "rebuild": options.rebuild,
+        "warmup": options.warmup,
+        "quick": options.quick,
+        "source_only": options.source_only,
+    }
+    if len(args) > 1:
+        run_options["num_runs"] = int(args[1])
+    EXPERIMENTS[name](**run_options)
+
+
+if __name__ == "__main__":
+    main()
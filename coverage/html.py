@@ -34,6 +34,7 @@ from coverage.version import __url__
 
 if TYPE_CHECKING:
     from coverage import Coverage
+    from coverage.plugin import CodeRegion
     from coverage.plugins import FileReporter
 
 
@@ -532,18 +533,28 @@ class HtmlReporter:
         """Write the other index pages for this report."""
         for ftr in files_to_report:
             region_nouns = [pair[0] for pair in ftr.fr.code_region_kinds()]
-            num_lines = len(ftr.fr.source().splitlines())
+            if not region_nouns:
+                # Don't read the source or find regions we won't report on.
+                continue
+            # Only used for membership tests, so one extra line number past
+            # the end doesn't matter, and we avoid allocating a list of lines.
+            num_lines = ftr.fr.source().count("\n") + 1
             outside_lines = set(range(1, num_lines + 1))
-            regions = ftr.fr.code_regions()
+            regions_by_kind: dict[str, list[CodeRegion]] = collections.defaultdict(list)
+            for region in ftr.fr.code_regions():
+                regions_by_kind[region.kind].append(region)
 
             for noun in region_nouns:
                 page_data = self.index_pages[noun]
 
-                for region in regions:
-                    if region.kind != noun:
-                        continue
+                noun_regions = regions_by_kind[noun]
+                for region in noun_regions:
                     outside_lines -= region.lines
-                    analysis = ftr.analysis.narrow(region.lines)
+                *region_analyses, outside_analysis = ftr.analysis.narrow_all(
+                    [region.lines for region in noun_regions] + [outside_lines],
+                )
+
+                for region, analysis in zip(noun_regions, region_analyses):
                     if not self.should_report(analysis, page_data):
                         continue
                     sorting_name = region.name.rpartition(".")[-1].lstrip("_")
@@ -558,8 +569,7 @@ class HtmlReporter:
                         nums=analysis.numbers,
                     ))
 
-                analysis = ftr.analysis.narrow(outside_lines)
-                if self.should_report(analysis, page_data):
+                if self.should_report(outside_analysis, page_data):
                     page_data.summaries.append(IndexItem(
                         url=ftr.html_filename,
                         file=escape(ftr.fr.relative_filename()),
@@ -568,7 +578,7 @@ class HtmlReporter:
                             + f"<span class='no-noun'>(no {escape(noun)})</span>"
                             + "</data>"
                         ),
-                        nums=analysis.numbers,
+                        nums=outside_analysis.numbers,
                     ))
 
         for noun, index_page in self.index_pages.items():
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import json
 import sys
 
@@ -43,26 +44,46 @@ class JsonReporter:
 
         `outfile` is a file object to write the json to.
 
+        The report is written as the files are analyzed.  Errors finding the
+        files to report, including "No data to report.", are raised before
+        anything is written, but an error analyzing a later file leaves
+        `outfile` with an incomplete report.
+
         """
         outfile = outfile or sys.stdout
         coverage_data = self.coverage.get_data()
         coverage_data.set_query_contexts(self.config.report_contexts)
+        has_arcs = coverage_data.has_arcs()
         self.report_data["meta"] = {
             "format": FORMAT_VERSION,
             "version": __version__,
             "timestamp": datetime.datetime.now().isoformat(),
-            "branch_coverage": coverage_data.has_arcs(),
+            "branch_coverage": has_arcs,
             "show_contexts": self.config.json_show_contexts,
         }
 
-        measured_files = {}
-        for file_reporter, analysis in get_analysis_to_report(self.coverage, morfs):
-            measured_files[file_reporter.relative_filename()] = self.report_one_file(
-                coverage_data,
-                analysis,
-            )
+        # Get the first file before writing anything, so that having no data
+        # to report doesn't leave a partial report behind.
+        analyses = get_analysis_to_report(self.coverage, morfs)
+        first = next(analyses, None)
+        if first is not None:
+            analyses = itertools.chain([first], analyses)
+
+        # Write the report as we go, so that the data for all of the files
+        # doesn't have to be in memory at once.
+        writer = JsonObjectWriter(
+            outfile,
+            indent=(4 if self.config.json_pretty_print else None),
+        )
+        writer.write("meta", self.report_data["meta"])
 
-        self.report_data["files"] = measured_files
+        files_writer = writer.start_object("files")
+        for file_reporter, analysis in analyses:
+            files_writer.write(
+                file_reporter.relative_filename(),
+                self.report_one_file(coverage_data, analysis),
+            )
+        files_writer.close()
 
         self.report_data["totals"] = {
             "covered_lines": self.total.n_executed,
@@ -73,7 +94,7 @@ class JsonReporter:
             "excluded_lines": self.total.n_excluded,
         }
 
-        if coverage_data.has_arcs():
+        if has_arcs:
             self.report_data["totals"].update({
                 "num_branches": self.total.n_branches,
                 "num_partial_branches": self.total.n_partial_branches,
@@ -81,11 +102,8 @@ class JsonReporter:
                 "missing_branches": self.total.n_missing_branches,
             })
 
-        json.dump(
-            self.report_data,
-            outfile,
-            indent=(4 if self.config.json_pretty_print else None),
-        )
+        writer.write("totals", self.report_data["totals"])
+        writer.close()
 
         return self.total.n_statements and self.total.pc_covered
 
@@ -109,26 +127,80 @@ class JsonReporter:
         }
         if self.config.json_show_contexts:
             reported_file["contexts"] = coverage_data.contexts_by_lineno(analysis.filename)
-        if coverage_data.has_arcs():
+        if analysis.has_arcs:
             summary.update({
                 "num_branches": nums.n_branches,
                 "num_partial_branches": nums.n_partial_branches,
                 "covered_branches": nums.n_executed_branches,
                 "missing_branches": nums.n_missing_branches,
             })
-            reported_file["executed_branches"] = list(
-                _convert_branch_arcs(analysis.executed_branch_arcs()),
+            reported_file["executed_branches"] = _convert_branch_arcs(
+                analysis.executed_branch_arcs(),
             )
-            reported_file["missing_branches"] = list(
-                _convert_branch_arcs(analysis.missing_branch_arcs()),
+            reported_file["missing_branches"] = _convert_branch_arcs(
+                analysis.missing_branch_arcs(),
             )
         return reported_file
 
 
+class JsonObjectWriter:
+    """Write a JSON object to a file one member at a time.
+
+    The text written is the same as `json.dump` would write for the complete
+    object, but the member values don't all need to be in memory at once.
+
+    """
+
+    def __init__(self, outfile: IO[str], indent: int | None, level: int = 0) -> None:
+        self.outfile = outfile
+        self.indent = indent
+        self.level = level
+        self.num_members = 0
+        self.outfile.write("{")
+
+    def _newline(self, level: int) -> str:
+        """The text to start a new line at nesting depth `level`."""
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * level)
+
+    def _write_key(self, key: str) -> None:
+        """Write the separator and `key` for the next member."""
+        if self.num_members:
+            self.outfile.write("," if self.indent is not None else ", ")
+        self.outfile.write(self._newline(self.level + 1) + json.dumps(key) + ": ")
+        self.num_members += 1
+
+    def write(self, key: str, value: Any) -> None:
+        """Write one member of the object."""
+        self._write_key(key)
+        # Our values are plain trees of dicts and lists, so skip the
+        # bookkeeping for detecting reference cycles.
+        text = json.dumps(value, indent=self.indent, check_circular=False)
+        if self.indent is not None:
+            # JSON strings can't contain raw newlines, so this only re-indents.
+            text = text.replace("\n", self._newline(self.level + 1))
+        self.outfile.write(text)
+
+    def start_object(self, key: str) -> JsonObjectWriter:
+        """Start a member whose value is an object to be written piecemeal.
+
+        Returns a new writer for the nested object, which must be closed
+        before anything more is written to this one.
+
+        """
+        self._write_key(key)
+        return JsonObjectWriter(self.outfile, self.indent, self.level + 1)
+
+    def close(self) -> None:
+        """Finish the object."""
+        if self.num_members:
+            self.outfile.write(self._newline(self.level))
+        self.outfile.write("}")
+
+
 def _convert_branch_arcs(
     branch_arcs: dict[TLineNo, list[TLineNo]],
-) -> Iterable[tuple[TLineNo, TLineNo]]:
+) -> list[tuple[TLineNo, TLineNo]]:
     """Convert branch arcs to a list of two-element tuples."""
-    for source, targets in branch_arcs.items():
-        for target in targets:
-            yield source, target
+    return [(source, target) for source, targets in branch_arcs.items() for target in targets]
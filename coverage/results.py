@@ -9,7 +9,7 @@ import collections
 import dataclasses
 
 from collections.abc import Container
-from typing import Iterable, TYPE_CHECKING
+from typing import Iterable, Sequence, TYPE_CHECKING
 
 from coverage.exceptions import ConfigError
 from coverage.misc import nice_pair
@@ -140,6 +140,68 @@ class Analysis:
             no_branch=no_branch,
         )
 
+    def narrow_all(self, line_sets: Sequence[Iterable[TLineNo]]) -> list[Analysis]:
+        """Create a narrowed Analysis for each of a number of sets of lines.
+
+        The result is the same as calling :meth:`narrow` for each element of
+        `line_sets`, but the data in this analysis is only examined once,
+        instead of once per set of lines.
+        """
+        owners: dict[TLineNo, list[int]] = {}
+        for i, lines in enumerate(line_sets):
+            for lno in lines:
+                owners.setdefault(lno, []).append(i)
+
+        def split_lines(lnos: Iterable[TLineNo]) -> list[set[TLineNo]]:
+            split: list[set[TLineNo]] = [set() for _ in line_sets]
+            for lno in lnos:
+                for i in owners.get(lno, ()):
+                    split[i].add(lno)
+            return split
+
+        def split_arcs(arcs: Iterable[TArc]) -> list[set[TArc]]:
+            split: list[set[TArc]] = [set() for _ in line_sets]
+            for arc in arcs:
+                for i in owners.get(arc[0], ()):
+                    split[i].add(arc)
+                for i in owners.get(arc[1], ()):
+                    split[i].add(arc)
+            return split
+
+        statements = split_lines(self.statements)
+        excluded = split_lines(self.excluded)
+        executed = split_lines(self.executed)
+
+        if self.has_arcs:
+            arc_possibilities = split_arcs(self._arc_possibilities_set)
+            arcs_executed = split_arcs(self._arcs_executed_set)
+            exit_counts: list[dict[TLineNo, int]] = [{} for _ in line_sets]
+            for lno, num in self.exit_counts.items():
+                for i in owners.get(lno, ()):
+                    exit_counts[i][lno] = num
+            no_branch = split_lines(self.no_branch)
+        else:
+            arc_possibilities = [set() for _ in line_sets]
+            arcs_executed = [set() for _ in line_sets]
+            exit_counts = [{} for _ in line_sets]
+            no_branch = [set() for _ in line_sets]
+
+        return [
+            Analysis(
+                precision=self.precision,
+                filename=self.filename,
+                has_arcs=self.has_arcs,
+                statements=statements[i],
+                excluded=excluded[i],
+                executed=executed[i],
+                _arc_possibilities_set=arc_possibilities[i],
+                _arcs_executed_set=arcs_executed[i],
+                exit_counts=exit_counts[i],
+                no_branch=no_branch[i],
+            )
+            for i in range(len(line_sets))
+        ]
+
     def missing_formatted(self, branches: bool = False) -> str:
         """The missing line numbers, formatted nicely.
 
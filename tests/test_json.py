@@ -5,15 +5,18 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 
 from datetime import datetime
 from typing import Any
 
+import pytest
+
 import coverage
 from coverage import Coverage
-from coverage.jsonreport import FORMAT_VERSION
+from coverage.jsonreport import FORMAT_VERSION, JsonObjectWriter
 
 from tests.coveragetest import UsingModulesMixin, CoverageTest
 
@@ -206,3 +209,53 @@ class JsonReportTest(UsingModulesMixin, CoverageTest):
 
     def test_context_relative(self) -> None:
         self.run_context_test(relative_files=True)
+
+    def test_files_are_sorted(self) -> None:
+        # The files are written as they are analyzed, so make sure they still
+        # come out in a stable order.
+        self.make_file("zed.py", "z = 1\n")
+        self.make_file("alpha.py", "a = 1\n")
+        self.make_file("sub/__init__.py", "")
+        self.make_file("sub/mid.py", "m = 1\n")
+        self.make_file("main.py", "import zed, alpha, sub.mid\n")
+        cov = coverage.Coverage()
+        self.start_import_stop(cov, "main")
+        cov.json_report(outfile="out.json")
+        with open("out.json") as result_file:
+            files = list(json.load(result_file)["files"])
+        expected = ["alpha.py", "main.py", "sub/__init__.py", "sub/mid.py", "zed.py"]
+        assert files == [os.path.normpath(f) for f in expected]
+
+    def test_no_data_to_stdout(self) -> None:
+        # With no data, nothing of the report should be written before the
+        # error message.
+        self.make_file("m.py", "m = 1\n")
+        self.run_command("coverage run m.py")
+        st, out = self.run_command_status("coverage json -o - --include=nomatch.py")
+        assert out == "No data to report.\n"
+        assert st == 1
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_json_object_writer(indent: int | None) -> None:
+    # The writer should produce exactly what json.dumps would.
+    data: dict[str, Any] = {
+        "meta": {"format": 2, "ok": True},
+        "files": {
+            "a.py": {"lines": [1, 2, 3], "contexts": {"1": ["a\nb"]}},
+            "b.py": {"lines": [], "summary": {"pc": 62.5}},
+        },
+        "empty": {},
+        "totals": {"n": 17},
+    }
+    outfile = io.StringIO()
+    writer = JsonObjectWriter(outfile, indent=indent)
+    writer.write("meta", data["meta"])
+    files_writer = writer.start_object("files")
+    for name, value in data["files"].items():
+        files_writer.write(name, value)
+    files_writer.close()
+    writer.start_object("empty").close()
+    writer.write("totals", data["totals"])
+    writer.close()
+    assert outfile.getvalue() == json.dumps(data, indent=indent)
@@ -12,7 +12,9 @@ from typing import Iterable, cast
 import pytest
 
 from coverage.exceptions import ConfigError
-from coverage.results import Numbers, display_covered, format_lines, should_fail_under
+from coverage.results import (
+    Analysis, Numbers, display_covered, format_lines, should_fail_under,
+)
 from coverage.types import TLineNo
 
 from tests.coveragetest import CoverageTest
@@ -161,3 +163,24 @@ def test_format_lines_with_arcs(
     result: str,
 ) -> None:
     assert format_lines(statements, lines, arcs) == result
+
+
+@pytest.mark.parametrize("has_arcs", [False, True])
+def test_narrow_all(has_arcs: bool) -> None:
+    analysis = Analysis(
+        precision=0,
+        filename="test.py",
+        has_arcs=has_arcs,
+        statements={1, 2, 3, 5, 6, 8, 9, 10},
+        excluded={4, 7},
+        executed={1, 2, 3, 8, 9},
+        _arc_possibilities_set={(-1, 1), (1, 2), (2, 3), (2, 5), (3, 8), (5, 6), (8, 9), (8, 10)},
+        _arcs_executed_set={(-1, 1), (1, 2), (2, 3), (3, 8), (8, 9)},
+        exit_counts={1: 1, 2: 2, 3: 1, 5: 1, 6: 1, 8: 2, 9: 1, 10: 1},
+        no_branch={9},
+    )
+    line_sets = [{2, 3}, {5, 6, 7}, {8, 9, 10}, {1, 4}, set()]
+    narrowed = analysis.narrow_all(line_sets)
+    expected = [analysis.narrow(lines) for lines in line_sets]
+    assert narrowed == expected
+    assert [a.numbers for a in narrowed] == [a.numbers for a in expected]